@@ -8,19 +8,23 @@ BaseRoute = "/api/v1"  # Common prefix for all endpoints
 apiSpec = None  # API specification
 apiVersion = None  # API specification version. Extracted from the OpenAPI document.
 backendVersion = "1.15.10"  # Backend version number
+combinedVersion = None  # API version with backend patch level offset appended
 
 
 def _loadOpenApiSpec():
-    global apiVersion, apiSpec
+    global apiVersion, apiSpec, combinedVersion
     try:
         import json
         with open("res/openapi.json", "r", encoding="utf-8") as file:
             apiSpec = json.load(file)
     except FileNotFoundError:
         import yaml
+        from tools.config import YamlLoader
         with open("res/openapi.yaml", "r", encoding="utf-8") as file:
-            apiSpec = yaml.load(file, Loader=yaml.SafeLoader)
+            apiSpec = yaml.load(file, Loader=YamlLoader)
     apiVersion = apiSpec["info"]["version"]
+    vdiff = int(backendVersion.rsplit(".", 1)[1])-int(apiVersion.rsplit(".", 1)[1])
+    combinedVersion = apiVersion if vdiff == 0 else "{}{:+}".format(apiVersion, vdiff)
 
 
 _loadOpenApiSpec()
@@ -68,10 +68,14 @@ class Cli:
         **kwargs : any
             Further keyword arguments
         """
-        self._createParser()
+        import os
+        import sys
+        command = None
+        if mode == "standalone" and "_ARGCOMPLETE" not in os.environ and len(sys.argv) > 1:
+            command = sys.argv[1]
+        self._createParser(command)
         if mode == "standalone":
             argcomplete.autocomplete(self.parser)
-        import sys
         self.mode = mode
         self.stdout = kwargs.get("stdout", sys.stdout)
         self.stdin = kwargs.get("stdin", sys.stdin)
@@ -100,6 +104,10 @@ class Cli:
         args : list of strings, optional
             Command line arguments to execute. The default is None.
         """
+        if self.__partial is not None:
+            import sys
+            if (sys.argv[1:] if args is None else args)[:1] != [self.__partial]:
+                self._createParser()
         self.__completing = False
         dispatch = self.parser.parse_args(args)
         self.__completing = True
@@ -202,8 +210,17 @@ class Cli:
         except Exception as err:
             logging.getLogger("config").error("Failed to initialize loggers: "+" - ".join(str(arg) for arg in err.args))
 
-    def _createParser(self):
-        """Create parser from registered functions."""
+    def _createParser(self, command=None):
+        """Create parser from registered functions.
+
+        If `command` is the name of a registered sub-command, only the sub-parser for this command is created.
+        The complete parser is created on demand if a different command is executed later.
+
+        Parameters
+        ----------
+        command : str, optional
+            Name of the only sub-command to set up. The default is None (set up all sub-commands).
+        """
         def redirect(parser):
             def perr(msg):
                 if not self.__completing:
@@ -219,9 +236,11 @@ class Cli:
                                   for p in a.choices.values()):
                     redirect(subparser)
 
+        funcs = [func for func in self.funcs if func[0] == command] or self.funcs
+        self.__partial = command if len(funcs) == 1 and len(self.funcs) > 1 else None
         self.parser = ArgumentParser(description="grommunio admin cli")
         subparsers = self.parser.add_subparsers()
-        for name, handler, parserSetup, kwargs in sorted(self.funcs):
+        for name, handler, parserSetup, kwargs in sorted(funcs):
             subp = subparsers.add_parser(name, **kwargs)
             subp.set_defaults(_handle=handler)
             parserSetup(subp)
@@ -468,6 +487,8 @@ class Cli:
             Completion or None (readline mode), or list of completions (complete mode)
         """
         self.__completing = True
+        if self.__partial is not None:
+            self._createParser()
         if self.completer is None:
             self.completer = argcomplete.CompletionFinder(self.parser, always_complete_options=False)
         if state is not None:
@@ -208,13 +208,13 @@ def cliConfigGet(args):
 def _traceFiles(args):
     import yaml
     from os import scandir
-    from tools.config import _defaultConfig
+    from tools.config import _defaultConfig, YamlLoader
     cli = args._cli
     defaultConfig = _defaultConfig()
     files = [("default", CTrace(defaultConfig))]
     try:
         with open("config.yaml", encoding="utf-8") as file:
-            fconf = yaml.load(file, Loader=yaml.SafeLoader)
+            fconf = yaml.load(file, Loader=YamlLoader)
     except Exception as err:
         cli.print(cli.col("Failed to open main config file: "+" - ".join(str(arg) for arg in err.args), "yellow"))
         return 1
@@ -228,7 +228,7 @@ def _traceFiles(args):
     for configFile in configFiles:
         try:
             with open(configFile, encoding="utf-8") as file:
-                fconf = yaml.load(file, Loader=yaml.SafeLoader)
+                fconf = yaml.load(file, Loader=YamlLoader)
             configFile = configFile.replace(confdir, "$CONFD")
             upd = CTrace(fconf)
             for old in files:
@@ -243,12 +243,12 @@ def _traceFiles(args):
 def _traceKeys(args):
     import yaml
     from os import scandir
-    from tools.config import _defaultConfig
+    from tools.config import _defaultConfig, YamlLoader
     cli = args._cli
     config = CTrace(_defaultConfig(), "default")
     try:
         with open("config.yaml", encoding="utf-8") as file:
-            fconf = yaml.load(file, Loader=yaml.SafeLoader)
+            fconf = yaml.load(file, Loader=YamlLoader)
     except Exception as err:
         cli.print(cli.col("Failed to open main config file: "+" - ".join(str(arg) for arg in err.args), "yellow"))
         return 1
@@ -260,7 +260,7 @@ def _traceKeys(args):
     for configFile in configFiles:
         try:
             with open(configFile, encoding="utf-8") as file:
-                fconf = yaml.load(file, Loader=yaml.SafeLoader)
+                fconf = yaml.load(file, Loader=YamlLoader)
             configFile = configFile.replace(confdir, "$CONFD")
             upd = CTrace(fconf, configFile)
             config.merge(upd)
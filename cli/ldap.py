@@ -372,18 +372,24 @@ def cliLdapCheck(args):
     cli.print("Checking {} user{}...".format(len(users), "" if len(users) == 1 else "s"))
     count, last = 0, time()
     orphaned = []
+    orgUsers = {}
     for user in users:
+        orgUsers.setdefault(user.orgID, []).append(user)
+    for orgID, members in orgUsers.items():
         try:
-            with Service("ldap", user.orgID) as ldap:
-                if ldap.getUserInfo(user.externID) is None:
-                    orphaned.append(user)
-                count += 1
-                if time()-last > 1:
-                    last = time()
-                    cli.print("\t{}/{} checked ({:.0f}%), {} orphaned"
-                              .format(count, len(users), count/len(users)*100, len(orphaned)))
+            with Service("ldap", orgID) as ldap:
+                found = ldap.getUserInfoBatched([user.externID for user in members])
+                # IDs are compared as stored, confirm misses with a server side match before reporting them
+                orphaned += [user for user in members
+                             if user.externID not in found and ldap.getUserInfo(user.externID) is None]
+            count += len(members)
+            if time()-last > 1:
+                last = time()
+                cli.print("\t{}/{} checked ({:.0f}%), {} orphaned"
+                          .format(count, len(users), count/len(users)*100, len(orphaned)))
         except ServiceUnavailableError:
-            cli.print(cli.col("\tFailed to check user '"+user.username+"' - LDAP not available", "red"))
+            for user in members:
+                cli.print(cli.col("\tFailed to check user '"+user.username+"' - LDAP not available", "red"))
     if len(orphaned) == 0:
         cli.print("Everything is ok")
         return
@@ -433,7 +439,7 @@ def cliLdapDump(args):
         for expr in args.user:
             for candidate in _getCandidates(expr, ldap):
                 cli.print(cli.col("ID: "+ldap.escape_filter_chars(candidate.ID), attrs=["bold"]))
-                cli.print(str(ldap.dumpUser(candidate.ID)))
+                cli.print(str(ldap.dumpUser(candidate.ID, full=not args.mapped)))
                 results += 1
     cli.print(cli.col("({} result{})".format(results, "s" if results != 1 else ""), attrs=["dark"]))
 
@@ -609,6 +615,7 @@ def _cliLdapParserSetup(subp: ArgumentParser):
     downsync.add_argument("-p", "--page-size", type=int, default=1000, help="Page size when downloading users")
     dump = sub.add_parser("dump", help="Dump LDAP object")
     dump.set_defaults(_handle=cliLdapDump)
+    dump.add_argument("-m", "--mapped", action="store_true", help="Only show attributes used for synchronization")
     dump.add_argument("-o", "--organization", metavar="ORGSPEC", help="Use organization specific LDAP connection")\
         .completer = _cliOrgspecCompleter
     dump.add_argument("user", nargs="+", help="User ID or search query string")
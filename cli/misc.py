@@ -45,18 +45,14 @@ def _versionParserSetup(subp: ArgumentParser):
 
 @Cli.command("version", _versionParserSetup, help="Show version information")
 def cliVersion(args):
-    from api import backendVersion, apiVersion
+    from api import backendVersion, apiVersion, combinedVersion
     cli = args._cli
     if args.api:
         cli.print(apiVersion)
     if args.backend:
         cli.print(backendVersion)
-    if args.combined or not any((args.api, args.backend, args.combined)):
-        vdiff = int(backendVersion.rsplit(".", 1)[1])-int(apiVersion.rsplit(".", 1)[1])
-        if vdiff == 0:
-            cli.print(apiVersion)
-        else:
-            cli.print("{}{:+}".format(apiVersion, vdiff))
+    if args.combined or not (args.api or args.backend):
+        cli.print(combinedVersion)
 
 
 def _setupTaginfo(subp: ArgumentParser):
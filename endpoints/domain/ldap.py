@@ -152,10 +152,15 @@ def checkLdapUsers():
     if len(users) == 0:
         return jsonify(message="No LDAP users found", **{"orphaned" if request.method == "GET" else "deleted": []})
     orphaned = []
+    orgUsers = {}
     for user in users:
-        with Service("ldap", user.orgID) as ldap:
-            if ldap.getUserInfo(user.externID) is None:
-                orphaned.append(user)
+        orgUsers.setdefault(user.orgID, []).append(user)
+    for orgID, members in orgUsers.items():
+        with Service("ldap", orgID) as ldap:
+            found = ldap.getUserInfoBatched([user.externID for user in members])
+            # IDs are compared as stored, confirm misses with a server side match before reporting them
+            orphaned += [user for user in members
+                         if user.externID not in found and ldap.getUserInfo(user.externID) is None]
     if len(orphaned) == 0:
         return jsonify(message="All LDAP users are valid", **{"orphaned" if request.method == "GET" else "deleted": []})
     orphanedData = [{"ID": user.ID, "username": user.username} for user in orphaned]
@@ -28,6 +28,9 @@ class DBConn:
         self.session = scoped_session(sessionmaker(self.engine), threading.get_ident)
         self.__version = None
         self.__maxversion = 0
+        self.__queries = threading.local()
+        if Config["DB"].get("countQueries"):
+            event.listen(self.engine, "before_cursor_execute", self.__countQuery)
         self.initVersion()
 
     def __reinit(self):
@@ -43,9 +46,40 @@ class DBConn:
 
         self.Base = declarative_base(cls=Model)
 
+    def __countQuery(self, *args, **kwargs):
+        self.__queries.count = getattr(self.__queries, "count", 0)+1
+
+    def queryCount(self, reset=False):
+        """Get number of statements executed by the current thread.
+
+        Only available if DB.countQueries is enabled.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            Reset counter after reading. The default is False.
+
+        Returns
+        -------
+        int
+            Number of statements executed since the last reset
+        """
+        count = getattr(self.__queries, "count", 0)
+        if reset:
+            self.__queries.count = 0
+        return count
+
     def enableFlask(self, API):
+        if Config["DB"].get("countQueries"):
+            @API.teardown_request
+            def logQueryCount(*args, **kwargs):
+                from flask import request
+                logger.debug("{} {} executed {} queries".format(request.method, request.path, self.queryCount()))
+
         @API.teardown_appcontext
         def removeSession(*args, **kwargs):
+            if Config["DB"].get("countQueries"):
+                self.queryCount(True)
             self.session.remove()
 
     def testConnection(self, verbose=False):
@@ -12,7 +12,7 @@ import idna
 import json
 
 import sqlalchemy
-from sqlalchemy import Column, func, inspect, select, ForeignKey
+from sqlalchemy import Column, Index, func, inspect, select, ForeignKey
 from sqlalchemy.dialects.mysql import DATE, INTEGER, TEXT, TINYINT, VARCHAR
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -23,14 +23,15 @@ from sqlalchemy.types import TypeDecorator
 class Orgs(DataModel, DB.Base):
     __tablename__ = "orgs"
 
-    ID = Column("id", INTEGER(10, unsigned=True), unique=True, primary_key=True, nullable=False)
+    ID = Column("id", INTEGER(10, unsigned=True), primary_key=True, nullable=False)
     name = Column("name", VARCHAR(32), nullable=False)
     description = Column("description", VARCHAR(128))
 
     domains = relationship("Domains", back_populates="org")
 
-    _dictmapping_ = ((Id(), Text("name", flags="patch")), (Text("description", flags="patch"), Int("domainCount")),
-                     (RefProp("domains", flags="patch"),))
+    _dictmapping_ = ((Id(), Text("name", flags="patch")),
+                     (Text("description", flags="patch"), Int("domainCount", flags="defer")),
+                     (RefProp("domains", flags="patch", qopt=selectinload),))
 
     def fromdict(self, patches, *args, **kwargs):
         domains = patches.pop("domains", None)
@@ -91,10 +92,12 @@ class OrgParam(DB.Base):
         _addIfDef(config["users"], "filter", plain, "ldap_user_filter")
         _addIfDef(config["users"], "contactFilter", plain, "ldap_contact_filter")
         _addIfDef(config["users"], "searchAttributes", plain, "ldap_user_search_attrs", all=True)
+        _addIfDef(config["users"], "searchMode", plain, "ldap_user_search_mode")
         _addIfDef(config["users"], "displayName", plain, "ldap_user_displayname")
         _addIfDef(config["users"], "defaultQuota", plain, "ldap_user_default_quota", type=int)
         _addIfDef(config["users"], "templates", plain, "ldap_user_templates", all=True)
         _addIfDef(config["users"], "aliases", plain, "ldap_user_aliases")
+        _addIfDef(config["users"], "dnTemplate", plain, "ldap_user_dn_template")
         _addIfDef(config["groups"], "groupaddr", plain, "ldap_group_addr")
         _addIfDef(config["groups"], "groupfilter", plain, "ldap_group_filter")
         _addIfDef(config["groups"], "groupname", plain, "ldap_group_name")
@@ -125,9 +128,11 @@ class OrgParam(DB.Base):
             _addIfDef(flat, "ldap_user_filter", config["users"], "filter")
             _addIfDef(flat, "ldap_contact_filter", config["users"], "contactFilter")
             _addIfDef(flat, "ldap_user_search_attrs", config["users"], "searchAttributes")
+            _addIfDef(flat, "ldap_user_search_mode", config["users"], "searchMode")
             _addIfDef(flat, "ldap_user_default_quota", config["users"], "defaultQuota")
             _addIfDef(flat, "ldap_user_templates", config["users"], "templates")
             _addIfDef(flat, "ldap_user_aliases", config["users"], "aliases")
+            _addIfDef(flat, "ldap_user_dn_template", config["users"], "dnTemplate")
             if "attributes" in config["users"] and config["users"]["attributes"]:
                 flat["ldap_user_attributes"] = ["{} {}".format(key, value)
                                                 for key, value in config["users"]["attributes"].items()]
@@ -169,21 +174,23 @@ class Domains(DataModel, DB.Base, NotifyTable):
 
     __tablename__ = "domains"
 
-    ID = Column("id", INTEGER(10, unsigned=True), unique=True, primary_key=True, nullable=False)
-    orgID = Column("org_id", INTEGER(10, unsigned=True), ForeignKey(Orgs.ID), nullable=False, server_default="0", index=True)
+    ID = Column("id", INTEGER(10, unsigned=True), primary_key=True, nullable=False)
+    orgID = Column("org_id", INTEGER(10, unsigned=True), ForeignKey(Orgs.ID), nullable=False, server_default="0")
     _domainname = Column("domainname", DomainName(64), nullable=False)
     homeserverID = OptionalC(105, "0", Column("homeserver", TINYINT(unsigned=True), nullable=False, server_default="0"))
-    homedir = Column("homedir", VARCHAR(128), nullable=False, server_default="")
+    homedir = Column("homedir", VARCHAR(128), nullable=False, default="", server_default="")
     maxUser = Column("max_user", INTEGER(10, unsigned=True), nullable=False)
-    title = Column("title", VARCHAR(128), nullable=False, server_default="")
-    address = Column("address", VARCHAR(128), nullable=False, server_default="")
-    adminName = Column("admin_name", VARCHAR(32), nullable=False, server_default="")
-    tel = Column("tel", VARCHAR(64), nullable=False, server_default="")
+    title = Column("title", VARCHAR(128), nullable=False, default="", server_default="")
+    address = Column("address", VARCHAR(128), nullable=False, default="", server_default="")
+    adminName = Column("admin_name", VARCHAR(32), nullable=False, default="", server_default="")
+    tel = Column("tel", VARCHAR(64), nullable=False, default="", server_default="")
     endDay = Column("end_day", DATE, nullable=False, default="3333-03-03")
     domainStatus = Column("domain_status", TINYINT, nullable=False, server_default="0")
     chatID = OptionalC(79, "NULL", Column("chat_id", VARCHAR(26)))
     _syncPolicy = OptionalC(77, "NULL", Column("sync_policy", TEXT))
 
+    __table_args__ = (Index("ix_domains_org_status", orgID, domainStatus),)
+
     org = relationship(Orgs, back_populates="domains")
     homeserver = OptionalNC(105, None,
                             relationship("Servers", foreign_keys=homeserverID, primaryjoin="Domains.homeserverID==Servers.ID"))
@@ -191,9 +198,9 @@ class Domains(DataModel, DB.Base, NotifyTable):
     _dictmapping_ = ((Id(), Text("domainname", flags="init"), "displayname"),
                      (Id("orgID", flags="patch"),
                       Int("maxUser", flags="patch"),
-                      Int("activeUsers"),
-                      Int("inactiveUsers"),
-                      Int("virtualUsers"),
+                      Int("activeUsers", flags="defer"),
+                      Int("inactiveUsers", flags="defer"),
+                      Int("virtualUsers", flags="defer"),
                       Text("title", flags="patch"),
                       Text("address", flags="patch"),
                       Text("adminName", flags="patch"),
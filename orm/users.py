@@ -10,6 +10,7 @@ from tools.DataModel import DataModel, Id, Text, Int, BoolP, RefProp, Bool, Date
 from tools.DataModel import InvalidAttributeError, MismatchROError, MissingRequiredAttributeError
 from tools.rop import nxTime
 
+import sqlalchemy
 from sqlalchemy import Column, ForeignKey, event, func, inspect, select
 from sqlalchemy.dialects.mysql import ENUM, INTEGER, TEXT, TIMESTAMP, TINYINT, VARBINARY, VARCHAR
 from sqlalchemy.exc import IntegrityError
@@ -22,12 +23,20 @@ import sys
 
 from datetime import datetime
 
-# Was moved in SQLA 1.4
-import sqlalchemy
-if sqlalchemy.__version__.split(".") >= ["1", "4"]:
-    from sqlalchemy.orm import DeclarativeMeta
-else:
-    from sqlalchemy.ext.declarative.api import DeclarativeMeta
+
+def _privilegeBit(name, bit):
+    """Create hybrid property `name` mapping a single bit of `Users.privilegeBits`."""
+    def getter(self):
+        return bool((self.privilegeBits or 0) & bit)
+
+    def setter(self, val):
+        self.privilegeBits = (self.privilegeBits or 0) | bit if val else (self.privilegeBits or 0) & ~bit
+
+    def expression(cls):
+        return cls.privilegeBits.op("&")(bit) != 0
+
+    getter.__name__ = setter.__name__ = expression.__name__ = name
+    return hybrid_property(getter, setter, expr=expression)
 
 
 class Users(DataModel, DB.Base, NotifyTable):
@@ -132,14 +141,14 @@ class Users(DataModel, DB.Base, NotifyTable):
 
     ID = Column("id", INTEGER(10, unsigned=True), nullable=False, primary_key=True, unique=True)
     username = Column("username", VARCHAR(320, charset="ascii"), nullable=False, unique=True)
-    _password = Column("password", VARCHAR(40), nullable=False, server_default="")
+    _password = Column("password", VARCHAR(40), nullable=False, default="", server_default="")
     domainID = Column("domain_id", INTEGER(10, unsigned=True), nullable=False, index=True)
-    maildir = Column("maildir", VARCHAR(128), nullable=False, server_default="")
+    maildir = Column("maildir", VARCHAR(128), nullable=False, default="", server_default="")
     addressStatus = Column("address_status", TINYINT, nullable=False, server_default="0")
     privilegeBits = Column("privilege_bits", INTEGER(10, unsigned=True), nullable=False, default=0)
     externID = Column("externid", VARBINARY(64))
     chatID = OptionalC(78, "NULL", Column("chat_id", VARCHAR(26)))
-    lang = Column("lang", VARCHAR(32), nullable=False, server_default="")
+    lang = Column("lang", VARCHAR(32), nullable=False, default="", server_default="")
     homeserverID = OptionalC(104, "0", Column("homeserver", TINYINT(unsigned=True), nullable=False, server_default="0"))
     _syncPolicy = OptionalC(76, "NULL", Column("sync_policy", TEXT))
     _deprecated_maxSize = OptionalC(-111, "0", Column("max_size", INTEGER(10), nullable=False, default=0))
@@ -386,107 +395,14 @@ class Users(DataModel, DB.Base, NotifyTable):
     def syncPolicy(self, value):
         self._syncPolicy = json.dumps(value, separators=(",", ":")) if value is not None else None
 
-    def _setPB(self, bit, val):
-        self.privilegeBits = (self.privilegeBits or 0) | bit if val else (self.privilegeBits or 0) & ~bit
-
-    def _getPB(self, bit):
-        return self.privilegeBits if isinstance(self, DeclarativeMeta) else bool((self.privilegeBits or 0) & bit)
-
-    @hybrid_property
-    def pop3_imap(self):
-        return self._getPB(self.USER_PRIVILEGE_POP3_IMAP)
-
-    @pop3_imap.setter
-    def pop3_imap(self, val):
-        self._setPB(self.USER_PRIVILEGE_POP3_IMAP, val)
-
-    @pop3_imap.expression
-    def pop3_imap(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_POP3_IMAP) != 0
-
-    @hybrid_property
-    def smtp(self):
-        return self._getPB(self.USER_PRIVILEGE_SMTP)
-
-    @smtp.setter
-    def smtp(self, val):
-        self._setPB(self.USER_PRIVILEGE_SMTP, val)
-
-    @smtp.expression
-    def smtp(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_SMTP) != 0
-
-    @hybrid_property
-    def changePassword(self):
-        return self._getPB(self.USER_PRIVILEGE_CHGPASSWD)
-
-    @changePassword.setter
-    def changePassword(self, val):
-        self._setPB(self.USER_PRIVILEGE_CHGPASSWD, val)
-
-    @changePassword.expression
-    def changePassword(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_CHGPASSWD) != 0
-
-    @hybrid_property
-    def publicAddress(self):
-        return self._getPB(self.USER_PRIVILEGE_PUBADDR)
-
-    @publicAddress.setter
-    def publicAddress(self, val):
-        self._setPB(self.USER_PRIVILEGE_PUBADDR, val)
-
-    @publicAddress.expression
-    def publicAddress(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_PUBADDR) != 0
-
-    @hybrid_property
-    def privChat(self):
-        return self._getPB(self.USER_PRIVILEGE_CHAT)
-
-    @privChat.setter
-    def privChat(self, val):
-        self._setPB(self.USER_PRIVILEGE_CHAT, val)
-
-    @privChat.expression
-    def privChat(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_CHAT) != 0
-
-    @hybrid_property
-    def privVideo(self):
-        return self._getPB(self.USER_PRIVILEGE_VIDEO)
-
-    @privVideo.setter
-    def privVideo(self, val):
-        self._setPB(self.USER_PRIVILEGE_VIDEO, val)
-
-    @privVideo.expression
-    def privVideo(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_VIDEO) != 0
-
-    @hybrid_property
-    def privFiles(self):
-        return self._getPB(self.USER_PRIVILEGE_FILES)
-
-    @privFiles.setter
-    def privFiles(self, val):
-        self._setPB(self.USER_PRIVILEGE_FILES, val)
-
-    @privFiles.expression
-    def privFiles(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_FILES) != 0
-
-    @hybrid_property
-    def privArchive(self):
-        return self._getPB(self.USER_PRIVILEGE_ARCHIVE)
-
-    @privArchive.setter
-    def privArchive(self, val):
-        self._setPB(self.USER_PRIVILEGE_ARCHIVE, val)
-
-    @privArchive.expression
-    def privArchive(cls):
-        return cls.privilegeBits.op("&")(cls.USER_PRIVILEGE_ARCHIVE) != 0
+    pop3_imap = _privilegeBit("pop3_imap", USER_PRIVILEGE_POP3_IMAP)
+    smtp = _privilegeBit("smtp", USER_PRIVILEGE_SMTP)
+    changePassword = _privilegeBit("changePassword", USER_PRIVILEGE_CHGPASSWD)
+    publicAddress = _privilegeBit("publicAddress", USER_PRIVILEGE_PUBADDR)
+    privChat = _privilegeBit("privChat", USER_PRIVILEGE_CHAT)
+    privVideo = _privilegeBit("privVideo", USER_PRIVILEGE_VIDEO)
+    privFiles = _privilegeBit("privFiles", USER_PRIVILEGE_FILES)
+    privArchive = _privilegeBit("privArchive", USER_PRIVILEGE_ARCHIVE)
 
     @property
     def ldapID(self):
@@ -846,7 +762,7 @@ class UserProperties(DB.Base):
 class Aliases(DataModel, DB.Base, NotifyTable):
     __tablename__ = "aliases"
 
-    aliasname = Column("aliasname", VARCHAR(128), nullable=False, unique=True, primary_key=True)
+    aliasname = Column("aliasname", VARCHAR(128), nullable=False, primary_key=True)
     mainname = Column("mainname", VARCHAR(128), ForeignKey(Users.username, ondelete="cascade", onupdate="cascade"),
                       nullable=False, index=True)
 
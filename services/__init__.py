@@ -3,6 +3,7 @@
 # SPDX-FileCopyrightText: 2021 grommunio GmbH
 
 import logging
+import threading
 
 
 class ServiceUnavailableError(Exception):
@@ -92,6 +93,7 @@ class ServiceHub(metaclass=_ServiceHubMeta):
             self._args = args
             self._failures = 0
             self._lastreload = 0
+            self._loadLock = threading.Lock()
             self._name = ServiceHub.servicename(service._name, *args)
             self._reloads = 0
             self._service = service
@@ -124,11 +126,21 @@ class ServiceHub(metaclass=_ServiceHubMeta):
             self.state = newstate
             return True
 
-        def load(self, force_reload=False):
+        def _reloadable(self):
             from time import time
-            if (self._state not in (ServiceHub.UNINITIALIZED, ServiceHub.SUSPENDED) or
-               time()-self._lastreload < self._service._reloadlocktime) and not force_reload:
+            return self._state in (ServiceHub.UNINITIALIZED, ServiceHub.SUSPENDED) and \
+                time()-self._lastreload >= self._service._reloadlocktime
+
+        def load(self, force_reload=False):
+            if not force_reload and not self._reloadable():
                 return
+            with self._loadLock:  # Let concurrent callers wait for a reload in progress instead of starting their own
+                if not force_reload and not self._reloadable():
+                    return
+                self._load()
+
+        def _load(self):
+            from time import time
             self._reloads += 1
             try:
                 self._checkArgs()
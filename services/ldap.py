@@ -7,11 +7,18 @@ from . import ServiceHub, ServiceDisabledError, ServiceUnavailableError, Instanc
 import ldap3
 import ldap3.core.exceptions as ldapexc
 import ldap3.utils.config as ldap3_conf
+import queue
 import re
 import threading
 import yaml
 
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from ldap3.protocol.rfc2696 import paged_search_control
 from ldap3.utils.conv import escape_filter_chars
+from ldap3.utils.dn import escape_rdn, safe_dn
 import logging
 logger = logging.getLogger("ldap")
 
@@ -27,6 +34,25 @@ def handleLdapError(service, error):
         return ServiceHub.SUSPENDED
 
 
+@lru_cache(maxsize=128)
+def _domainClause(attr, domains):
+    """Generate filter expression matching any of the domains.
+
+    Parameters
+    ----------
+    attr : str
+        Name of the username attribute
+    domains : tuple of str
+        Domain names
+
+    Returns
+    -------
+    str
+        LDAP filter expression
+    """
+    return "(|{})".format("".join("({}=*@{})".format(attr, d) for d in domains))
+
+
 def argname(orgID=None):
     if orgID is not None:
         from orm.domains import Orgs
@@ -48,40 +74,44 @@ def orgid(orgspec):
 
 
 class SearchResult:
+    __slots__ = ("_ldap", "DN", "type", "error", "ID", "data", "name", "email", "username")
+
     def __init__(self, ldap, resultType, data):
         self._ldap = ldap
-        userconf, groupconf = ldap._config["users"], ldap._config["groups"]
         self.DN = data.get("dn")
         self.type = resultType
         self.error = None
-        if "raw_attributes" in data and "attributes" in data:
-            self.ID = data["raw_attributes"][ldap._config["objectID"]][0]
-            self.data = data["attributes"]
-            self.name = self._reduce(data["attributes"].get(userconf["displayName"], ""))
+        attributes = data.get("attributes")
+        if attributes is not None and "raw_attributes" in data:
+            self.ID = data["raw_attributes"][ldap._objectID][0]
+            self.data = attributes
+            self.name = self._reduce(attributes.get(ldap._displayNameAttr, ""))
         else:
             self.ID = self.data = self.name = self.email = None
             self.error = "Not a valid object"
             return
         if resultType == "user":
-            if userconf["username"] in data["attributes"] and data["attributes"][userconf["username"]]:
-                self.email = self.username = self._reduce(data["attributes"][userconf["username"]]).lower()
+            username = attributes.get(ldap._usernameAttr)
+            if username:
+                self.email = self.username = self._reduce(username).lower()
             else:
                 self.email = self.username = None
                 self.error = "Missing username"
         elif resultType == "contact":
             self.username = None
-            if userconf["contactname"] in data["attributes"] and data["attributes"][userconf["contactname"]]:
-                self.email = self._reduce(data["attributes"][userconf["contactname"]]).lower()
+            contactname = attributes.get(ldap._contactNameAttr)
+            if contactname:
+                self.email = self._reduce(contactname).lower()
             else:
                 self.email = None
                 self.error = "Missing e-mail address"
         elif resultType == "group":
-            self.email = self._reduce(data["attributes"].get(groupconf["groupaddr"]))
+            self.email = self._reduce(attributes.get(ldap._groupAddrAttr))
             if not self.email:
                 self.error = "Missing e-mail address"
             else:
                 self.email = self.email.lower()
-            self.name = self._reduce(data["attributes"].get(groupconf["groupname"], ""))
+            self.name = self._reduce(attributes.get(ldap._groupNameAttr, ""))
         else:
             self.error = "Unknown type"
 
@@ -116,6 +146,26 @@ class SearchResult:
             res = (value, [])
         return res if tail else res[0]
 
+    def _mapAttributes(self, props):
+        """Add mapped LDAP attributes to property dict.
+
+        Parameters
+        ----------
+        props : dict
+            Property dict to update
+
+        Returns
+        -------
+        dict
+            The updated property dict
+        """
+        data = {attr.lower(): value for attr, value in self.data.items()}
+        for attr, prop in self._ldap._userAttributeItems:
+            value = data.get(attr)
+            if value is not None and value != []:
+                props[prop] = " ".join(str(a) for a in value) if isinstance(value, list) else value
+        return props
+
     def userdata(self, props=None):
         if self.type == "contact":
             return self.contactdata(props)
@@ -124,29 +174,21 @@ class SearchResult:
         self._chkConvert("user")
         ldap = self._ldap
         ldapuser = self.data
-        username, aliases = self._reduce(ldapuser[ldap._config["users"]["username"]], tail=True)
+        username, aliases = self._reduce(ldapuser[ldap._usernameAttr], tail=True)
         userdata = dict(username=username.lower(), aliases=aliases)
-        userdata["properties"] = props or ldap._defaultProps.copy()
-        userdata["properties"].update({prop: " ".join(str(a) for a in ldapuser[attr]) if isinstance(ldapuser[attr], list)
-                                       else ldapuser[attr] for attr, prop in ldap._userAttributes.items() if attr in ldapuser})
-        if ldap._config["users"].get("aliases"):
-            aliasattr = ldap._config["users"]["aliases"]
-            if ldapuser.get(aliasattr) is not None:
-                from tools import formats
-                aliases = ldapuser[aliasattr]
-                aliases = aliases if isinstance(aliases, list) else [aliases]
-                aliases = [alias[5:] if alias.lower().startswith("smtp:") else alias for alias in aliases]
-                userdata["aliases"] += [alias for alias in aliases if formats.email.match(alias)]
+        userdata["properties"] = self._mapAttributes(props or ldap._defaultProps.copy())
+        aliases = ldapuser.get(ldap._aliasesAttr) if ldap._aliasesAttr else None
+        if aliases is not None:
+            from tools import formats
+            aliases = aliases if isinstance(aliases, list) else [aliases]
+            aliases = [alias[5:] if alias.lower().startswith("smtp:") else alias for alias in aliases]
+            userdata["aliases"] += [alias for alias in aliases if formats.email.match(alias)]
         return userdata
 
     def contactdata(self, props=None):
         self._chkConvert("contact")
-        ldap = self._ldap
-        ldapuser = self.data
         userdata = {}
-        userdata["properties"] = props or ldap._defaultProps.copy()
-        userdata["properties"].update({prop: " ".join(str(a) for a in ldapuser[attr]) if isinstance(ldapuser[attr], list)
-                                       else ldapuser[attr] for attr, prop in ldap._userAttributes.items() if attr in ldapuser})
+        userdata["properties"] = self._mapAttributes(props or self._ldap._defaultProps.copy())
         return userdata
 
     def groupdata(self, props=None):
@@ -159,6 +201,10 @@ class LdapService:
     __initialized = False
     _templates = {}
     _unescapeRe = re.compile(rb"\\(?P<value>[a-fA-F0-9]{2})")
+    _filterSpecialRe = re.compile(r"[\\*()\x00]")
+    _escapeTable = str.maketrans({"\\": "\\5c", "*": "\\2a", "(": "\\28", ")": "\\29", "\x00": "\\00"})
+    _batchSize = 500  # Maximum number of IDs to combine into a single search filter
+    _searchModes = {"exact": "({}={{q}})", "prefix": "({}={{q}}*)", "medial": "({}=*{{q}}*)"}
 
     _configMap = {"baseDn": "ldap_search_base",
                   "objectID": "ldap_object_id",
@@ -177,8 +223,9 @@ class LdapService:
             return
         ldap3.set_config_parameter("POOLING_LOOP_TIMEOUT", 1)
         try:
+            from tools.config import YamlLoader
             with open("res/ldapTemplates.yaml", encoding="utf-8") as file:
-                cls._templates = yaml.load(file, Loader=yaml.SafeLoader)
+                cls._templates = yaml.load(file, Loader=YamlLoader)
         except Exception:
             pass
         cls.__initialized = True
@@ -190,13 +237,41 @@ class LdapService:
             self._config = mconf.LDAP
         else:
             self._config = self._loadOrgConfig(orgID)
-        self._userAttributes = self._checkConfig(self._config)
-        self.lock = threading.Lock()
+        self._userAttributes = MappingProxyType(self._checkConfig(self._config))
+        self._userAttributeItems = tuple((attr.lower(), prop) for attr, prop in self._userAttributes.items())
+        userconf = self._config["users"]
+        self._objectID = self._config["objectID"]
+        self._sbase = self._searchBase(self._config)
+        self._dnTemplate = userconf.get("dnTemplate")
+        self._starttls = bool(self._config["connection"].get("starttls"))
+        self._authLocal = threading.local()
+        self._usernameAttr = userconf["username"]
+        self._displayNameAttr = userconf["displayName"]
+        self._aliasesAttr = userconf.get("aliases")
+        self._contactNameAttr = userconf.get("contactname")
+        groupconf = self._config["groups"] or {}
+        self._groupAddrAttr = groupconf.get("groupaddr")
+        self._groupNameAttr = groupconf.get("groupname")
+        self._searchAttributes = tuple(userconf["searchAttributes"])
+        self._syncAttributes = tuple(attr for attr in dict.fromkeys((self._usernameAttr, self._aliasesAttr,
+                                                                     *self._userAttributes)) if attr)
+        self._userFilterPrefix = "(&"+self._filtersExpr(userconf)+userconf.get("filter", "")
+        self._contactFilter = userconf.get("contactFilter")
+        self._groupFilter = groupconf.get("groupfilter")
+        self._matchTemplate = "({}={{}})".format(self._objectID)
+        searchExpr = self._searchModes[userconf.get("searchMode", "medial")]
+        self._searchTemplate = "(|{})".format("".join(searchExpr.format(sattr) for sattr in self._searchAttributes))
+        self._attrSets = {}
+        self._pool = queue.LifoQueue()
+        self._poolSlots = threading.BoundedSemaphore(self._config["connection"].get("connections") or 4)
         if self._config.get("disabled"):
             raise ServiceDisabledError("Service disabled by configuration")
         try:
-            self.conn = self.testConnection(self._config)
-        except ldap3.core.exceptions.LDAPInvalidDnError:
+            self._server = self._createServer(self._config)
+            self.conn = self.testConnection(self._config, server=self._server)
+            self._pool.put(self.conn)
+            self._authServer = self._createServer(self._config, ldap3.NONE)
+        except ldapexc.LDAPInvalidDnError:
             raise ServiceUnavailableError("Invalid base DN")
         except Exception as err:
             msg = str(err.args[0]) if len(err.args) else type(err).__name__
@@ -210,20 +285,29 @@ class LdapService:
     def _attrSet(self, name, mode="user"):
         if isinstance(name, (list, tuple)):
             return name
-        common = (self._config["objectID"],)
+        attrs = self._attrSets.get((name, mode))
+        if attrs is None:
+            attrs = self._attrSets[(name, mode)] = self._buildAttrSet(name, mode)
+        return attrs
+
+    def _buildAttrSet(self, name, mode):
+        common = (self._objectID,)
         if name == "idonly":
             return common
         if name == "all":
             return common+("*",)
         if mode == "group":
-            groupconf = self._config["groups"]
-            return common+(groupconf["groupaddr"], groupconf["groupname"])
-        userconf = self._config["users"]
-        common += (userconf["displayName"],)
+            return common+(self._groupAddrAttr, self._groupNameAttr)
+        if name == "sync":  # Attributes unknown to the server schema would be rejected by ldap3
+            schema = self.conn.server.schema
+            if schema is None:
+                return common+("*",)
+            return common+tuple(attr for attr in self._syncAttributes if attr in schema.attribute_types)
+        common += (self._displayNameAttr,)
         if mode == "user":
-            return common+(userconf["username"],)
+            return common+(self._usernameAttr,)
         elif mode == "contact":
-            return (common+(userconf["contactname"],)) if self._config["enableContacts"] else common
+            return (common+(self._contactNameAttr,)) if self._config["enableContacts"] else common
 
     @classmethod
     def _checkConfig(cls, config):
@@ -236,6 +320,16 @@ class LdapService:
         for required in ("username", "searchAttributes", "displayName"):
             if required not in config["users"] or config["users"][required] is None or len(config["users"][required]) == 0:
                 raise KeyError("Missing required config value '{}'".format(cls._configMap.get(required, "user."+required)))
+        if config["users"].get("searchMode", "medial") not in cls._searchModes:
+            raise ValueError("Unknown search mode '{}'".format(config["users"]["searchMode"]))
+        dnTemplate = config["users"].get("dnTemplate")
+        if dnTemplate:
+            if "{id}" not in dnTemplate:
+                raise ValueError("DN template '{}' does not contain '{{id}}'".format(dnTemplate))
+            try:
+                safe_dn(dnTemplate.format(id="id"))
+            except (ldapexc.LDAPInvalidDnError, IndexError, KeyError, ValueError):
+                raise ValueError("Invalid DN template '{}'".format(dnTemplate))
         _templatesEnabled = config["users"].get("templates", [])
         userAttributes = {}
         if "filter" in config["users"]:
@@ -275,7 +369,7 @@ class LdapService:
         str
             A string containing LDAP match filter expression.
         """
-        return "({}={})".format(self._config["objectID"], self.escape_filter_chars(ID))
+        return self._matchTemplate.format(self._escapeID(ID))
 
     def _matchFiltersMulti(self, IDs):
         """Generate match filters string for multiple IDs.
@@ -292,14 +386,59 @@ class LdapService:
         str
             A string containing LDAP match filter expression.
         """
-        return "(|{})".format("".join("({}={})".format(self._config["objectID"], self.escape_filter_chars(ID)) for ID in IDs))
+        template, escape = self._matchTemplate, self._escapeID
+        return "(|{})".format("".join([template.format(escape(ID)) for ID in IDs]))
+
+    @classmethod
+    def _escapeID(cls, ID):
+        """Escape object ID for use in a filter expression.
+
+        IDs without special characters are used as-is, everything else is passed to escape_filter_chars.
 
-    @property
-    def _sbase(self):
-        return self._searchBase(self._config)
+        Parameters
+        ----------
+        ID : str or bytes
+            Object ID
 
-    def _search(self, baseFilter, *args, attributes=None, domains=None, filterIncomplete=True, limit=None, userconf=None,
-                types=None, customFilter="", **kwargs):
+        Returns
+        -------
+        str
+            Escaped ID
+        """
+        text = ID.decode("ascii") if isinstance(ID, bytes) and ID.isascii() else ID
+        if isinstance(text, str) and cls._filterSpecialRe.search(text) is None:
+            return text
+        return cls.escape_filter_chars(ID)
+
+    @contextmanager
+    def _connection(self):
+        """Borrow a connection from the connection pool.
+
+        Blocks until a connection is available if the maximum number of connections is in use.
+        Connections that failed due to communication errors are not returned to the pool.
+
+        Yields
+        ------
+        ldap3.Connection
+            Bound LDAP connection
+        """
+        with self._poolSlots:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = self.testConnection(self._config, active=False, server=self._server)
+            broken = False
+            try:
+                yield conn
+            except (ldapexc.LDAPCommunicationError, ldapexc.LDAPMaximumRetriesError):
+                broken = True
+                raise
+            finally:
+                if not broken:
+                    self._pool.put(conn)
+
+    def _search(self, baseFilter, *args, attributes=None, domains=None, filterIncomplete=True, limit=None, types=None,
+                customFilter="", **kwargs):
         """Perform async search query.
 
         Parameters
@@ -314,41 +453,48 @@ class LdapService:
         list
             Search result list
         """
-        def filtered(results):
-            return list(filter(lambda r: r.error is None, results)) if filterIncomplete else list(results)
+        def entries(filterExpr, *args, **kwargs):
+            cookie = None
+            try:
+                while True:
+                    if not conn.search(self._sbase, filterExpr, *args, **kwargs, paged_cookie=cookie):
+                        return
+                    response = conn.response
+                    cookie = conn.result.get("controls", {}).get("1.2.840.113556.1.4.319", {}).get("value", {}).get("cookie")
+                    yield from response
+                    if not cookie:
+                        return
+            except GeneratorExit:
+                if cookie:  # Closed before the last page, abandon paged search so the server can release the result set
+                    conn.search(self._sbase, filterExpr, *args, controls=[paged_search_control(False, 0, cookie)],
+                                **{key: value for key, value in kwargs.items() if key != "paged_size"})
+                raise
 
         def searchPaged(typeFilter, type, *args, **kwargs):
             filterExpr = "(&{}{}{})".format(baseFilter, typeFilter, customFilter)
-            if not self.conn.search(self._sbase, filterExpr, *args, **kwargs):
-                return []
-            results = filtered(SearchResult(self, type, result) for result in self.conn.response)
-            cookie = self.conn.result.get("controls", {}).get("1.2.840.113556.1.4.319", {}).get("value", {}).get("cookie")
-            while cookie and (not limit or len(results) < limit) and \
-                  self.conn.search(self._sbase, filterExpr, *args, **kwargs, paged_cookie=cookie):
-                results += filtered(SearchResult(self, type, result) for result in self.conn.response)
-                cookie = self.conn.result.get("controls", {}).get("1.2.840.113556.1.4.319", {}).get("value", {}).get("cookie")
-            return results[:limit] if limit and len(results) > limit else results
+            with closing(entries(filterExpr, *args, **kwargs)) as response:
+                results = (SearchResult(self, type, entry) for entry in response)
+                if filterIncomplete:
+                    results = (result for result in results if result.error is None)
+                return list(islice(results, limit) if limit else results)
 
         if limit:
             kwargs["paged_size"] = min(limit, kwargs.get("paged_size") or limit)
         types = types or ("user", "contact", "group")
-        userconf = userconf or self._config["users"]
-        username = userconf["username"]
-        domainexpr = "(|{})".format("".join("({}=*@{})".format(username, d) for d in domains)) if domains is not None else ""
-        filterexpr = "".join("("+f+")" for f in userconf.get("filters", ()))
-        userFilter = "(&{}{}{})".format(filterexpr, userconf.get("filter", ""), domainexpr)
-        with self.lock:
+        domainexpr = _domainClause(self._usernameAttr, tuple(sorted(domains))) if domains is not None else ""
+        userFilter = self._userFilterPrefix+domainexpr+")"
+        with self._connection() as conn:
             results = []
             if "user" in types:
                 results += searchPaged(userFilter, "user", *args, attributes=self._attrSet(attributes, "user"), **kwargs)
                 limit = None if limit is None else limit-len(results)
             if self._config["enableContacts"] and "contact" in types and (limit is None or limit > 0):
-                contacts = searchPaged(self._config["users"]["contactFilter"], "contact", *args,
+                contacts = searchPaged(self._contactFilter, "contact", *args,
                                        attributes=self._attrSet(attributes, "contact"), **kwargs)
                 results += contacts
                 limit = None if limit is None else limit-len(contacts)
             if self._config["groups"] and "group" in types and (limit is None or limit > 0):
-                results += searchPaged(self._config["groups"]["groupfilter"], "group", *args,
+                results += searchPaged(self._groupFilter, "group", *args,
                                        attributes=self._attrSet(attributes, "group"), **kwargs)
         return results
 
@@ -367,13 +513,10 @@ class LdapService:
             return conf["users"]["subtree"]+","+conf["baseDn"]
         return conf["baseDn"]
 
-    @classmethod
-    def _searchFilters(cls, query, userconf, domains=None):
+    def _searchFilters(self, query):
         """Generate search filters string.
 
-        Includes a filter for each entry in ldap.users.filters and adds substring filters for all attributes in
-        ldap.users.searchAttributes.
-        Optionally, an additional list of permitted domains can be used to further restrict matches.
+        Adds substring filters for all attributes in ldap.users.searchAttributes.
 
         Parameters
         ----------
@@ -385,11 +528,7 @@ class LdapService:
         str
             A string including all search filters.
         """
-        if query:
-            query = cls.escape_filter_chars(query)
-            return "(|{})".format("".join(("("+sattr+"=*"+query+"*)" for sattr in userconf["searchAttributes"])))
-        else:
-            return ""
+        return self._searchTemplate.replace("{q}", self.escape_filter_chars(query)) if query else ""
 
     @classmethod
     def _loadOrgConfig(cls, orgID):
@@ -414,17 +553,84 @@ class LdapService:
         str
             Error message if authentication failed or None if successful
         """
-        response = self._search(self._matchFilters(ID), attributes="idonly", filterIncomplete=False)
-        if len(response) == 0:
-            return "Invalid Username or password"
-        if len(response) > 1:
-            return "Multiple entries found - please contact your administrator"
-        userDN = response[0].DN
-        try:
-            ldap3.Connection(self._config["connection"].get("server"), user=userDN, password=password, auto_bind=True)
-        except ldapexc.LDAPBindError:
+        if not password:
+            return "Invalid username or Password"
+        userDN = self._templateDN(ID)
+        if userDN is None:
+            response = self._search(self._matchFilters(ID), attributes="idonly", filterIncomplete=False)
+            if len(response) == 0:
+                return "Invalid Username or password"
+            if len(response) > 1:
+                return "Multiple entries found - please contact your administrator"
+            userDN = response[0].DN
+        if not self._bindUser(userDN, password):
             return "Invalid username or Password"
 
+    def _bindUser(self, userDN, password):
+        """Bind user with the authentication connection of the current thread.
+
+        The connection is only used for binds and is kept open to be rebound for subsequent authentications.
+        It is cached only after opening (and StartTLS, if configured) succeeded and is discarded on any error.
+        If the connection was lost, a new one is opened and the bind is retried once.
+
+        Parameters
+        ----------
+        userDN : str
+            DN of the user
+        password : str
+            Password of the user
+
+        Returns
+        -------
+        bool
+            True if the bind was successful, False otherwise
+        """
+        for retry in (True, False):
+            conn = getattr(self._authLocal, "conn", None)
+            try:
+                if conn is None or conn.closed:
+                    conn = ldap3.Connection(self._authServer, read_only=True)
+                    conn.open()
+                    if self._starttls and not conn.start_tls():
+                        raise ldapexc.LDAPStartTLSError("Failed to initiate StartTLS connection")
+                    self._authLocal.conn = conn
+                conn.authentication, conn.user, conn.password = ldap3.SIMPLE, userDN, password
+                success = conn.bind()
+                conn.password = None
+                return success
+            except Exception as err:
+                self._authLocal.conn = None
+                if conn is not None and not conn.closed:
+                    try:
+                        conn.unbind()
+                    except ldapexc.LDAPException:
+                        pass
+                if not retry or not isinstance(err, ldapexc.LDAPCommunicationError):
+                    raise
+
+    def _templateDN(self, ID):
+        """Generate user DN from configured template.
+
+        Users authenticated with the generated DN are bound directly, without checking the configured user filters
+        or the uniqueness of the object ID.
+
+        Parameters
+        ----------
+        ID : str or bytes
+            ID of the LDAP object representing the user
+
+        Returns
+        -------
+        str
+            User DN or None if no template is configured or the result is not a valid DN
+        """
+        if not self._dnTemplate:
+            return None
+        try:
+            return safe_dn(self._dnTemplate.format(id=escape_rdn(ID.decode("utf-8") if isinstance(ID, bytes) else ID)))
+        except (ldapexc.LDAPInvalidDnError, IndexError, KeyError, ValueError):
+            return None
+
     def downsyncUser(self, ID, props=None):
         """Create dictionary representation of the user from LDAP data.
 
@@ -448,7 +654,7 @@ class LdapService:
             Dictionary representation of the LDAP user
         """
         try:
-            response = self._search(self._matchFilters(ID), attributes="all")
+            response = self._search(self._matchFilters(ID), attributes="sync")
         except Exception:
             return None
         if len(response) == 0:
@@ -457,33 +663,64 @@ class LdapService:
             raise RuntimeError("Multiple entries found - aborting")
         return response[0].userdata()
 
-    def dumpUser(self, ID):
+    def dumpUser(self, ID, full=True):
         """Download complete user description.
 
         Parameters
         ----------
         ID : str ot bytes
             LDAP object ID of the user
+        full : bool, optional
+            Include all attributes instead of only those used for synchronization. The default is True.
 
         Returns
         -------
         ldap3.abstract.entry.Entry
             LDAP object or None if not found or ambiguous
         """
-        res = self._search(self._matchFilters(ID), attributes="all")
+        try:
+            res = self._search(self._matchFilters(ID), attributes="all" if full else "sync")
+        except ldapexc.LDAPInvalidValueError:
+            return None
         if len(res) != 1:
             return None
         res = res[0]
         return yaml.dump({"DN": res.DN})+yaml.dump({"attributes": dict(res.data)})
 
-    @staticmethod
-    def escape_filter_chars(text, encoding=None):
+    @classmethod
+    def escape_filter_chars(cls, text, encoding=None):
+        """Escape special characters for use in a filter expression.
+
+        Behaves like ldap3.utils.conv.escape_filter_chars, but uses str.translate for strings and UTF-8 encoded bytes.
+        Bytes that are not valid UTF-8 are escaped completely.
+
+        Parameters
+        ----------
+        text : str or bytes
+            Value to escape
+        encoding : str, optional
+            Encoding of bytes values. If set, escaping is delegated to ldap3. The default is None.
+
+        Returns
+        -------
+        str
+            Escaped value
+        """
+        if encoding is None:
+            if isinstance(text, bytes):
+                try:
+                    text = text.decode("utf-8")
+                except UnicodeDecodeError:
+                    return "\\"+text.hex("\\")
+            if isinstance(text, str):
+                return text.translate(cls._escapeTable)
         return escape_filter_chars(text, encoding)
 
     def getAll(self, IDs):
         """Get user information for each ID.
 
-        Queries the same information as getUserInfo.
+        Queries the same information as getUserInfo, combining up to 500 IDs into a single search.
+        If a batch contains an ID that is not valid for the object ID attribute, its IDs are looked up separately.
 
         Parameters
         ----------
@@ -495,7 +732,30 @@ class LdapService:
         list
             List of GenericObjects with information about found users
         """
-        return self._search(self._matchFiltersMulti(IDs))
+        IDs = list(IDs)
+        results = []
+        for offset in range(0, len(IDs), self._batchSize):
+            batch = IDs[offset:offset+self._batchSize]
+            try:
+                results += self._search(self._matchFiltersMulti(batch), paged_size=self._batchSize)
+            except ldapexc.LDAPInvalidValueError:  # Look up individually to skip only the invalid IDs
+                results += filter(None, (self.getUserInfo(ID) for ID in batch))
+        return results
+
+    def getUserInfoBatched(self, IDs):
+        """Get user information for multiple IDs using batched searches.
+
+        Parameters
+        ----------
+        IDs : list of bytes or str
+            IDs to search
+
+        Returns
+        -------
+        dict
+            Mapping of LDAP object ID to search result for each object found
+        """
+        return {result.ID: result for result in self.getAll(IDs)}
 
     def getUserInfo(self, ID):
         """Get e-mail address of an ldap user.
@@ -536,6 +796,8 @@ class LdapService:
                     customFilter="", attributes=None):
         """Search for ldap users matching the query.
 
+        Objects whose ID matches the (unescaped) query exactly are returned first.
+
         Parameters
         ----------
         query : str
@@ -556,19 +818,24 @@ class LdapService:
         list
             List of user objects containing ID, e-mail and name
         """
+        searchFilter = self._searchFilters(query)
+        kwargs = dict(domains=domains, paged_size=pageSize, limit=limit, filterIncomplete=filterIncomplete, types=types,
+                      customFilter=customFilter)
+        exactID = self.unescapeFilterChars(query) if query else None
+        if not exactID:
+            return self._search(searchFilter, **kwargs)
+        try:  # Match object ID in the same request, exact matches are moved to the front
+            response = self._search("(|{}{})".format(self._matchFilters(exactID), searchFilter), **kwargs)
+            exact = [result for result in response if result.ID == exactID]
+            return exact+[result for result in response if result.ID != exactID]
+        except ldapexc.LDAPInvalidValueError:  # Query is not a valid value for the object ID attribute
+            pass
         try:
-            exact = self.getUserInfo(self.unescapeFilterChars(query))
+            exact = self.getUserInfo(exactID)
             exact = [] if exact is None else [exact]
         except Exception:
             exact = []
-        response = self._search(self._searchFilters(query, self._config["users"], domains),
-                                domains=domains,
-                                paged_size=pageSize,
-                                limit=limit,
-                                filterIncomplete=filterIncomplete,
-                                types=types,
-                                customFilter=customFilter)
-        return exact+response
+        return exact+self._search(searchFilter, **kwargs)
 
     @classmethod
     def testConfig(cls, config):
@@ -585,28 +852,63 @@ class LdapService:
         except Exception as err:
             return "Could not connect to LDAP server: "+" - ".join(str(v) for v in err.args)
 
+    @staticmethod
+    def _createServer(config, getInfo=ldap3.SCHEMA):
+        """Create server object from configuration.
+
+        Parameters
+        ----------
+        config : dict
+            LDAP configuration
+        getInfo : str, optional
+            Server information to fetch after binding. The default is ldap3.SCHEMA.
+
+        Returns
+        -------
+        ldap3.Server or ldap3.ServerPool
+            Server object if a single server is configured, server pool otherwise
+        """
+        servers = [ldap3.Server(s[:-1] if s.endswith("/") else s, get_info=getInfo)
+                   for s in config["connection"]["server"].split()]
+        return servers[0] if len(servers) == 1 else ldap3.ServerPool(servers, "FIRST", active=1)
+
+    @staticmethod
+    def _filtersExpr(userconf):
+        """Combine additional user filters into a single expression.
+
+        Parameters
+        ----------
+        userconf : dict
+            User configuration
+
+        Returns
+        -------
+        str
+            Concatenated filter expressions
+        """
+        return "".join("("+f+")" for f in userconf.get("filters", ()))
+
     @classmethod
-    def testConnection(cls, config, active=True):
-        servers = [s[:-1] if s.endswith("/") else s for s in config["connection"]["server"].split()]
-        pool = servers[0] if len(servers) == 1 else ldap3.ServerPool(servers, "FIRST", active=1)
+    def testConnection(cls, config, active=True, server=None):
         user = config["connection"].get("bindUser")
         password = config["connection"].get("bindPass")
         starttls = config["connection"].get("starttls")
-        conn = ldap3.Connection(pool, user=user, password=password, client_strategy=ldap3.RESTARTABLE)
+        conn = ldap3.Connection(server or cls._createServer(config), user=user, password=password,
+                                client_strategy=ldap3.RESTARTABLE, read_only=True)
         if starttls and not conn.start_tls():
             logger.warning("Failed to initiate StartTLS connection")
         if not conn.bind():
             raise ldapexc.LDAPBindError("LDAP bind failed ({}): {}".format(conn.result["description"], conn.result["message"]))
         if active:
             userconf = config["users"]
-            filterexpr = "".join("("+f+")" for f in userconf.get("filters", ()))
+            filterexpr = cls._filtersExpr(userconf)
             userFilter = "(&{}{})".format(filterexpr, userconf.get("filter", ""))
             attrs = (config["objectID"], userconf["displayName"], userconf["username"])
-            conn.search(cls._searchBase(config), userFilter, attributes=attrs, paged_size=0)
+            conn.search(cls._searchBase(config), userFilter, attributes=attrs, paged_size=0, size_limit=1)
             if config.get("enableContacts"):
                 contactFilter = "(&{}{})".format(filterexpr, userconf.get("contactFilter", ""))
                 attrs = (config["objectID"], userconf["displayName"], userconf["contactname"])
-                conn.search(cls._searchBase(config), contactFilter, attributes=attrs, paged_size=0)
+                conn.search(cls._searchBase(config), contactFilter, attributes=attrs, paged_size=0, size_limit=1)
         return conn
 
     @classmethod
@@ -626,10 +928,8 @@ class LdapService:
         bytes
             bytes object containing unescaped data
         """
-        raw = bytes(text, "utf-8")
-        last = 0
-        unescaped = bytes()
-        for match in cls._unescapeRe.finditer(raw):
-            unescaped += raw[last:match.start()]+bytes((int(match.group("value"), 16),))
-            last = match.end()
-        return unescaped if last != 0 else raw
+        return cls._unescapeRe.sub(cls._unescapeByte, bytes(text, "utf-8"))
+
+    @staticmethod
+    def _unescapeByte(match):
+        return bytes.fromhex(match.group("value").decode("ascii"))
@@ -4,7 +4,7 @@
 
 from sqlalchemy import func, or_, String
 from sqlalchemy.inspection import inspect as inspecc
-from sqlalchemy.orm import joinedload, aliased
+from sqlalchemy.orm import aliased, defer, joinedload
 
 from collections.abc import Iterable
 
@@ -78,6 +78,7 @@ class DataModel:
                         The default is None.
                     - match: Use this attribute for matching. Can also be set with _matchables_
                     - hidden: The attribute is not included at any level
+                    - defer: Do not load the attribute in optimized queries that do not include it
             args : Collection, optional
                 List of arguments passed to the function if `call` or `func` is set. The default is None.
             kwargs : dict, optional
@@ -382,11 +383,16 @@ class DataModel:
         cls._init()
         if isinstance(spec, int):
             propsel = lambda prop: "ref" in prop.flags
+            included = set(cls._meta.props(spec))
         else:
             sspec = set(spec)
             propsel = lambda prop: "ref" in prop.flags and prop.attr in sspec
+            included = set(cls._meta.props(predicate=lambda prop: prop.attr in sspec))
             spec = None
-        return query.options(prop.qopt(prop.value(cls, "raw")) for prop in cls._meta.props(spec, propsel))
+        options = [prop.qopt(prop.value(cls, "raw")) for prop in cls._meta.props(spec, propsel)]
+        options += [defer(prop.value(cls, "raw")) for prop in cls._meta.props(predicate=lambda prop: "defer" in prop.flags)
+                    if prop not in included]
+        return query.options(*options)
 
     @classmethod
     def optimized_query(cls, spec):
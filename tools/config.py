@@ -8,6 +8,11 @@ from os import scandir
 
 logger = logging.getLogger("config")
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def _defaultConfig():
     _defaultSyncPolicy = {
@@ -155,7 +160,7 @@ def _loadConfig_():
     config = _defaultConfig()
     try:
         with open("config.yaml", "r", encoding="utf-8") as file:
-            _recursiveMerge_(config, yaml.load(file, Loader=yaml.SafeLoader))
+            _recursiveMerge_(config, yaml.load(file, Loader=YamlLoader))
     except Exception as err:
         logger.error("Failed to load 'config.yaml': {}".format(" - ".join(str(arg) for arg in err.args)))
     if "confdir" in config:
@@ -167,7 +172,7 @@ def _loadConfig_():
         for configFile in configFiles:
             try:
                 with open(configFile, encoding="utf-8") as file:
-                    confd = yaml.load(file, Loader=yaml.SafeLoader)
+                    confd = yaml.load(file, Loader=YamlLoader)
                 if confd is not None:
                     _recursiveMerge_(config, confd)
             except Exception as err:
@@ -195,7 +200,7 @@ def validate():
         from openapi_spec_validator.validation.exceptions import ValidationError
     try:
         with open("res/config.yaml", encoding="utf-8") as file:
-            configSchema = yaml.load(file, yaml.loader.SafeLoader)
+            configSchema = yaml.load(file, Loader=YamlLoader)
     except Exception:
         return "Could not open schema file"
     validator = OAS30Validator(configSchema)
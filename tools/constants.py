@@ -1187,8 +1187,9 @@ class FolderNames():
             return
         try:
             import yaml
+            from .config import YamlLoader
             with open("res/foldernames.yaml", encoding="utf-8") as file:
-                cls._lang = yaml.load(file, Loader=yaml.SafeLoader)
+                cls._lang = yaml.load(file, Loader=YamlLoader)
         except Exception:
             pass
 
@@ -166,10 +166,10 @@ def importContact(candidate, ldap, orgID, syncExisting=False, domains=None, **kw
                 synced.append(user)
     existingDomains = {user.domainID for user in existing}
     domains = [domain for domain in domains if domain.ID not in existingDomains]
+    contactData = ldap.downsyncUser(candidate.ID) if domains else None
     for domain in domains:
-        contactData = ldap.downsyncUser(candidate.ID)
-        contactData["domainID"] = domain.ID
-        result, code = Users.mkContact(contactData, candidate.ID)
+        data = dict(contactData, properties=dict(contactData["properties"]), domainID=domain.ID)
+        result, code = Users.mkContact(data, candidate.ID)
         if code != 201:
             errors.append((f"Failed to import contact {candidate.email} into {domain.domainname}: {result}", code))
         else:
@@ -87,10 +87,12 @@ def _transformLdap(conf):
     _addIfDef(LDAP["users"], "filter", conf, "ldap_user_filter")
     _addIfDef(LDAP["users"], "contactFilter", conf, "ldap_contact_filter")
     _addIfDef(LDAP["users"], "searchAttributes", conf, "ldap_user_search_attrs", all=True)
+    _addIfDef(LDAP["users"], "searchMode", conf, "ldap_user_search_mode")
     _addIfDef(LDAP["users"], "displayName", conf, "ldap_user_displayname")
     _addIfDef(LDAP["users"], "defaultQuota", conf, "ldap_user_default_quota", type=int)
     _addIfDef(LDAP["users"], "templates", conf, "ldap_user_templates", all=True)
     _addIfDef(LDAP["users"], "aliases", conf, "ldap_user_aliases")
+    _addIfDef(LDAP["users"], "dnTemplate", conf, "ldap_user_dn_template")
     _addIfDef(LDAP["groups"], "groupaddr", conf, "ldap_group_addr")
     _addIfDef(LDAP["groups"], "groupfilter", conf, "ldap_group_filter")
     _addIfDef(LDAP["groups"], "groupname", conf, "ldap_group_name")
@@ -118,9 +120,11 @@ def _flattenLdap(conf):
         _addIfDef(LDAP, "ldap_user_filter", conf["users"], "filter")
         _addIfDef(LDAP, "ldap_contact_filter", conf["users"], "contactFilter")
         _addIfDef(LDAP, "ldap_user_search_attrs", conf["users"], "searchAttributes")
+        _addIfDef(LDAP, "ldap_user_search_mode", conf["users"], "searchMode")
         _addIfDef(LDAP, "ldap_user_default_quota", conf["users"], "defaultQuota")
         _addIfDef(LDAP, "ldap_user_templates", conf["users"], "templates")
         _addIfDef(LDAP, "ldap_user_aliases", conf["users"], "aliases")
+        _addIfDef(LDAP, "ldap_user_dn_template", conf["users"], "dnTemplate")
         if "attributes" in conf["users"]:
             LDAP["ldap_user_attributes"] = ["{} {}".format(key, value) for key, value in conf["users"]["attributes"].items()]
     if "groups" in conf: